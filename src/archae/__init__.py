@@ -1,8 +1,41 @@
 """Archae explodes archives."""
 
-from archae.config import option_keys
-from archae.extractor import ArchiveExtractor
-from archae.util.enum.warning_types import WarningTypes
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from archae.extractor import ArchiveExtractor
+    from archae.util.enum.warning_types import WarningTypes
+
+    Options: list[str]
 
-Options = option_keys()
 __all__ = ["ArchiveExtractor", "Options", "WarningTypes"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public API on first access so the CLI can start without it.
+
+    Args:
+        name (str): The attribute being looked up.
+
+    Returns:
+        Any: The requested public attribute.
+    """
+    if name == "ArchiveExtractor":
+        from archae.extractor import ArchiveExtractor  # noqa: PLC0415
+
+        value: Any = ArchiveExtractor
+    elif name == "Options":
+        from archae.config import option_keys  # noqa: PLC0415
+
+        value = option_keys()
+    elif name == "WarningTypes":
+        from archae.util.enum.warning_types import WarningTypes  # noqa: PLC0415
+
+        value = WarningTypes
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
@@ -4,14 +4,19 @@ from __future__ import annotations
 
 import logging
 import pathlib
-from importlib import metadata
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import rich_click as click
 
-from archae.config import apply_options, get_options
-from archae.extractor import ArchiveExtractor, ExtractionWarning
-from archae.util.tool_manager import ToolManager
+# Attaches the handler that prints archae's log messages
+import archae.util.warning_accumulator  # noqa: F401
+
+if TYPE_CHECKING:
+    from archae.util.warning_accumulator import ExtractionWarning
+
+# Config, extraction and tool discovery pull in dynaconf and libmagic, so they
+# are imported inside the commands that need them to keep --help/--version fast.
 
 logger = logging.getLogger("archae")
 logger.setLevel(logging.INFO)
@@ -27,9 +32,12 @@ logger.setLevel(logging.INFO)
         text_markup=True,
     ),
 )
-@click.version_option(metadata.version("archae"), "-v", "--version")
+@click.version_option(None, "-v", "--version", package_name="archae")
 def cli() -> None:
     """Archae explodes archives."""
+    from archae.config import ensure_user_config  # noqa: PLC0415
+
+    ensure_user_config()
 
 
 @cli.command()
@@ -69,6 +77,10 @@ def extract(
     extract_dir: pathlib.Path,
 ) -> None:
     """Extract and analyze an archive."""
+    from archae.config import apply_options  # noqa: PLC0415
+    from archae.extractor import ArchiveExtractor  # noqa: PLC0415
+    from archae.util.tool_manager import ToolManager  # noqa: PLC0415
+
     # Apply any options from the command line, then convert any convertible settings
     if options:
         apply_options(dict(options))
@@ -84,6 +96,8 @@ def extract(
 @cli.command()
 def listopts() -> None:
     """List all available configuration options."""
+    from archae.config import get_options  # noqa: PLC0415
+
     options = get_options()
 
     # Load default settings
@@ -113,6 +127,10 @@ def listopts() -> None:
 @cli.command()
 def status() -> None:
     """Show archae status and available tools."""
+    from importlib import metadata  # noqa: PLC0415
+
+    from archae.util.tool_manager import ToolManager  # noqa: PLC0415
+
     logger.info("Archae status:")
     logger.info("Version: %s", metadata.version("archae"))
     ToolManager.locate_tools()
@@ -156,23 +174,25 @@ def status() -> None:
 
 def print_tracked_files(tracked_files: dict[str, dict]) -> None:
     """Print the tracked files for debugging purposes."""
-    logger.info("------------------------------------------------")
+    # Build the whole dump first and log it once rather than per line
+    lines = ["------------------------------------------------"]
     for hash, info in tracked_files.items():
-        logger.info("Hash: %s", hash)
-        logger.info("  Size: %s bytes", info.get("size", "Unknown"))
-        for path in info.get("paths", []):
-            logger.info("  Path: %s", path)
-        logger.info("  Metadata:")
-        for key, value in info.get("metadata", {}).items():
-            logger.info("    %s: %s", key, value)
+        lines.append(f"Hash: {hash}")
+        lines.append(f"  Size: {info.get('size', 'Unknown')} bytes")
+        lines.extend(f"  Path: {path}" for path in info.get("paths", []))
+        lines.append("  Metadata:")
+        lines.extend(
+            f"    {key}: {value}" for key, value in info.get("metadata", {}).items()
+        )
+    logger.info("\n".join(lines))
 
 
 def print_warnings(warnings: list[ExtractionWarning]) -> None:
     """Print accumulated warnings for debugging purposes."""
-    logger.info("------------------------------------------------")
+    lines = ["------------------------------------------------"]
     if len(warnings) == 0:
-        logger.info("No warnings.")
-        return
-    logger.info("Accumulated Warnings:")
-    for warning in warnings:  # type: ignore[attr-defined]
-        logger.info(warning.message)
+        lines.append("No warnings.")
+    else:
+        lines.append("Accumulated Warnings:")
+        lines.extend(warning.message for warning in warnings)
+    logger.info("\n".join(lines))
@@ -2,30 +2,30 @@
 
 import ast
 import importlib
+import logging
 import typing
+from functools import cache
 from pathlib import Path
 
 import platformdirs
 import yaml
 from dynaconf import Dynaconf
 
+from archae.util.enum.warning_types import WarningTypes
+
+logger = logging.getLogger("archae")
+
 # Get the package directory for default settings
 package_dir = Path(__file__).parent
 default_settings_file = package_dir / "default_settings.toml"
 
 # Get the config directory following XDG standards
 config_dir = Path(platformdirs.user_config_dir("archae"))
-config_dir.mkdir(parents=True, exist_ok=True)
 
-# Define the user config file path
+# Define the user config file path; it is created by ensure_user_config(), and
+# Dynaconf skips it until then
 user_config_file = config_dir / "settings.toml"
 
-# Create a default settings.toml if it doesn't exist
-if not user_config_file.exists():
-    user_config_file.write_text("""# Archae configuration
-# Override defaults from the package here
-""")
-
 settings = Dynaconf(
     envvar_prefix="ARCHAE",
     settings_files=[
@@ -46,13 +46,38 @@ default_settings = Dynaconf(
 
 options_file = package_dir / "options.yaml"
 
+_BUILTIN_CONVERTERS: dict[str, typing.Callable] = {
+    "float": float,
+    "int": int,
+    "bool": ast.literal_eval,
+}
+
 
+def ensure_user_config() -> Path:
+    """Create a commented user settings.toml if it doesn't exist yet.
+
+    Returns:
+        Path: The path to the user config file.
+    """
+    if not user_config_file.exists():
+        config_dir.mkdir(parents=True, exist_ok=True)
+        user_config_file.write_text("""# Archae configuration
+# Override defaults from the package here
+""")
+    return user_config_file
+
+
+@cache
 def get_options() -> dict:
-    """Return the contents of options.yaml."""
+    """Return the contents of options.yaml, parsed once per process.
+
+    The result is shared between callers and must not be modified.
+    """
     with Path.open(options_file) as f:
         return yaml.safe_load(f)
 
 
+@cache
 def get_converter(converter_def: str) -> typing.Callable:
     """Dynamically import and instantiate a converter class.
 
@@ -63,12 +88,8 @@ def get_converter(converter_def: str) -> typing.Callable:
         Converter function.
     """
     # Handle built-in types
-    if converter_def == "float":
-        return float
-    if converter_def == "int":
-        return int
-    if converter_def == "bool":
-        return ast.literal_eval
+    if converter_def in _BUILTIN_CONVERTERS:
+        return _BUILTIN_CONVERTERS[converter_def]
 
     # Split the definition into module path and class name
     module_name, class_name = converter_def.split(":")
@@ -89,15 +110,30 @@ def apply_options(option_list: dict[str, str | int | float | bool]) -> None:
     """
     options = get_options()
     for key, value in option_list.items():
-        # Find the option definition by matching the key
-        option_def = None
-        for def_key in options:
-            option_def = options[def_key]
-            break
-        if option_def:
-            settings[key] = value
+        # Option keys are uppercase, but like Dynaconf accept any case
+        option_key = key.upper()
+        if option_key in options:
+            settings[option_key] = value
         else:
-            pass
+            logger.warning(
+                "%s: Ignoring unknown option %s; use 'archae listopts' to see available options.",
+                WarningTypes.UNKNOWN_OPTION.name,
+                key,
+            )
+
+
+@cache
+def _convert_plan() -> tuple[tuple[str, typing.Callable], ...]:
+    """Resolve the converter of every option that defines one.
+
+    Returns:
+        tuple[tuple[str, typing.Callable], ...]: Pairs of option key and converter function.
+    """
+    return tuple(
+        (key, get_converter(option_def["converter"]))
+        for key, option_def in get_options().items()
+        if "converter" in option_def
+    )
 
 
 def convert_settings(settings_dict: dict) -> dict:
@@ -109,11 +145,8 @@ def convert_settings(settings_dict: dict) -> dict:
     Returns:
         dict: The converted settings dictionary.
     """
-    options = get_options()
-    for key in options:
-        option_def = options[key]
-        if "converter" in option_def and key in settings_dict:
-            converter = get_converter(option_def["converter"])
+    for key, converter in _convert_plan():
+        if key in settings_dict:
             settings_dict[key] = converter(settings_dict[key])
     return settings_dict
 
@@ -2,65 +2,60 @@
 
 from __future__ import annotations
 
+import contextlib
+import fnmatch
 import hashlib
 import logging
+import mmap
+import os
 import shutil
-from typing import TYPE_CHECKING
-
-import magic
+import sys
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
 from archae.config import apply_options, get_default_settings, get_settings
 from archae.util.enum.warning_types import WarningTypes
 from archae.util.file_tracker import FileTracker
+from archae.util.file_type import HEAD_SIZE, identify
 from archae.util.tool_manager import ToolManager
+from archae.util.warning_accumulator import ExtractionWarning, accumulator
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterable, Iterator
 
     from archae.util.archiver.base_archiver import BaseArchiver
 from archae.util.lists import skip_delete_extensions, skip_delete_mimetypes
 
+# Read size for hashing the remainder of a file after its head.
+HASH_CHUNK_SIZE = 1024 * 1024
+# Files larger than this are hashed through a memory map in a single update.
+MMAP_HASH_THRESHOLD = 16 * 1024 * 1024
+# Extractions between resamples of the free disk space estimate.
+FREE_SPACE_RESYNC_INTERVAL = 64
 
-class ExtractionWarning:
-    """Warning wrapper class for extraction issues."""
-
-    def __init__(self, message: str, warning_type: WarningTypes) -> None:
-        """Initialize the Warning.
-
-        Args:
-            message (str): The warning message.
-            warning_type (WarningTypes): The type of the warning.
-        """
-        self.message = message
-        self.warning_type = warning_type
 
+class FileProbe(NamedTuple):
+    """What a single read of a file found out about it."""
 
-class WarningAccumulator(logging.Handler):
-    """Logging handler to accumulate warnings while still printing them."""
+    file_hash: str
+    head: bytes
+    stat: os.stat_result | None
 
-    def __init__(self) -> None:
-        """Initialize the WarningAccumulator."""
-        super().__init__()
-        self.warnings: list[ExtractionWarning] = []
 
-    def emit(self, record: logging.LogRecord) -> None:
-        """Print and accumulate warning messages."""
-        if record.levelno == logging.WARNING:
-            rendered = self.format(record)
-            warning = ExtractionWarning(rendered, WarningTypes(rendered.split(":")[0]))
-            self.warnings.append(warning)
-        print(self.format(record))  # noqa: T201
+class ExtractedArchive(NamedTuple):
+    """An extracted archive whose contents are still being handled."""
 
-    def clear_warnings(self) -> None:
-        """Clear the accumulated warnings."""
-        self.warnings.clear()
+    children: Iterator[tuple[Path, FileProbe]]
+    depth: int
+    file_path: Path
+    base_hash: str
 
 
 logger = logging.getLogger("archae")
-logger.setLevel(logging.INFO)
-accumulator = WarningAccumulator()
-logger.addHandler(accumulator)
-logger.setLevel(logging.DEBUG)
 
 
 class ArchiveExtractor:
@@ -73,71 +68,223 @@ class ArchiveExtractor:
             extract_dir (Path): The base directory for extraction. Defaults to current working directory + extracted.
         """
         self.extract_dir = extract_dir
-        if self.extract_dir.exists() and self.extract_dir.is_dir():
-            shutil.rmtree(self.extract_dir)
+        # Background removal of previous runs' extractions, if still running
+        self._cleanup_thread = self._discard_previous_runs(self.extract_dir)
         self.extract_dir.mkdir(exist_ok=True)
         self.file_tracker = FileTracker()
+        self._stat_hashes: dict[tuple[int, int, int, int, int], str] = {}
         if ToolManager.get_tools() == {}:
             ToolManager.locate_tools()
 
+    @staticmethod
+    def _is_empty_directory(directory: Path) -> bool:
+        """Check whether a directory has no entries, reading at most one.
+
+        Args:
+            directory (Path): The directory to check.
+
+        Returns:
+            bool: True if the directory is empty, False otherwise.
+        """
+        with os.scandir(directory) as entries:
+            return next(entries, None) is None
+
+    @classmethod
+    def _discard_previous_runs(cls, directory: Path) -> threading.Thread | None:
+        """Clear an extraction directory, deleting its contents in the background where possible.
+
+        The directory is first moved aside within its parent, as a hidden
+        ".<name>-*.old" directory, so its path can be reused straight away;
+        large previous extractions then don't hold up startup. Such directories
+        left behind by runs stopped before their deletion finished are removed
+        along with it, so the deletion need not finish before the process exits.
+        An empty directory from a previous run is reused as is.
+
+        Args:
+            directory (Path): The extraction directory.
+
+        Returns:
+            threading.Thread | None: The thread deleting moved-aside directories, or None if there are none.
+        """
+        if not directory.parent.is_dir():
+            return None
+        if directory.is_dir() and not cls._is_empty_directory(directory):
+            trash = Path(
+                tempfile.mkdtemp(
+                    prefix=f".{directory.name}-", suffix=".old", dir=directory.parent
+                )
+            )
+            try:
+                directory.rename(trash / directory.name)
+            except OSError:
+                # e.g. the directory is a mount point; delete it in place instead
+                trash.rmdir()
+                shutil.rmtree(directory)
+        prefix = f".{directory.name}-"
+        with os.scandir(directory.parent) as entries:
+            trash_dirs = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(".old")
+                and entry.is_dir(follow_symlinks=False)
+            ]
+        if not trash_dirs:
+            return None
+        cleanup_thread = threading.Thread(
+            target=cls._remove_directories,
+            args=(trash_dirs,),
+            name="archae-cleanup",
+            # Don't hold up exit; anything left is swept on the next run
+            daemon=True,
+        )
+        cleanup_thread.start()
+        return cleanup_thread
+
+    @staticmethod
+    def _remove_directories(directories: Iterable[str]) -> None:
+        """Delete directories and their contents, ignoring errors.
+
+        Args:
+            directories (Iterable[str]): The directories to delete.
+        """
+        for directory in directories:
+            shutil.rmtree(directory, ignore_errors=True)
+
     def handle_file(self, file_path: Path) -> None:
         """Handle a file given its path.
 
         Args:
             file_path (Path): The path to the file.
         """
-        accumulator.clear_warnings()
-        self.file_tracker.reset_tracked_files()
-        self._handle_file(file_path)
+        # Warnings logged before the run, e.g. about its options, are kept
+        accumulator.start_run()
+        try:
+            self.file_tracker.reset_tracked_files()
+            self._stat_hashes.clear()
+            # Settings can't change mid-run, so convert them once for all files
+            self._settings = settings_dict = get_settings()
+            self._hash_algorithm = settings_dict["HASH_ALGORITHM"]
+            max_workers = settings_dict["MAX_WORKERS"] or os.cpu_count() or 1
+            # Keep a couple of files per worker in flight so results are ready
+            # when the main thread gets to them without piling up heads in memory.
+            self._prefetch = max_workers * 2
+            # Sampled at the start of the run, then estimated between resyncs
+            self._free_space = shutil.disk_usage(self.extract_dir).free
+            self._extraction_count = 0
+            with ThreadPoolExecutor(max_workers=max_workers) as self._pool:
+                self._handle_tree(file_path)
+        finally:
+            accumulator.finish_run()
+
+    def _handle_tree(self, file_path: Path) -> None:
+        """Handle a file and, depth first, everything extracted from it.
+
+        Nested archives are tracked on an explicit stack rather than by
+        recursion, so deeply nested input cannot exhaust the call stack.
 
-    def _handle_file(self, file_path: Path, depth: int = 1) -> None:
-        """Internal implementation of handle_file.
+        Args:
+            file_path (Path): The path to the file.
+        """
+        stack: list[ExtractedArchive] = []
+        # Hashes of the archives on the stack, so an archive that contains
+        # itself is not extracted again and again
+        self._active_hashes: set[str] = set()
+        extracted = self._handle_file(file_path)
+        if extracted:
+            stack.append(extracted)
+            self._active_hashes.add(extracted.base_hash)
+        while stack:
+            child = next(stack[-1].children, None)
+            if child is None:
+                finished = stack.pop()
+                self._active_hashes.discard(finished.base_hash)
+                self._cleanup(finished.file_path, finished.base_hash)
+                continue
+            child_file, probe = child
+            extracted = self._handle_file(child_file, stack[-1].depth, probe)
+            if extracted:
+                stack.append(extracted)
+                self._active_hashes.add(extracted.base_hash)
+
+    def _handle_file(
+        self,
+        file_path: Path,
+        depth: int = 1,
+        probe: FileProbe | None = None,
+    ) -> ExtractedArchive | None:
+        """Examine a single file, extracting it if it is an archive.
 
         Args:
             file_path (Path): The path to the file.
             depth (int): The current depth in the archive extraction tree. Defaults to 1.
+            probe (FileProbe | None): The file's probe if already computed by a worker.
+
+        Returns:
+            ExtractedArchive | None: The extracted archive whose contents still need handling, if any.
         """
         logger.info("Starting examination of file: %s", file_path)
 
-        base_hash = self._sha256_hash_file(file_path)
-        self._track_file_metadata(base_hash, file_path)
+        probe = probe or self._probe_file(file_path)
+        base_hash = probe.file_hash
+        self._track_file_metadata(base_hash, file_path, probe)
 
-        is_file_archive = self._is_archive(base_hash)
-        self.file_tracker.add_metadata(base_hash, "is_archive", is_file_archive)
+        archiver = self._get_archiver_for_file(base_hash)
+        self.file_tracker.add_metadata(base_hash, "is_archive", archiver is not None)
 
-        if is_file_archive:
-            self._process_archive(base_hash, file_path, depth)
+        if archiver is None:
+            return None
+        return self._process_archive(base_hash, file_path, depth, archiver)
 
-    def _track_file_metadata(self, base_hash: str, file_path: Path) -> None:
+    def _track_file_metadata(
+        self, base_hash: str, file_path: Path, probe: FileProbe
+    ) -> None:
         """Track file size and metadata including type, mime type, and extension.
 
         Args:
             base_hash (str): The SHA-256 hash of the file.
             file_path (Path): The path to the file.
+            probe (FileProbe): The file's probe, whose head identifies its type.
         """
-        file_size_bytes = file_path.stat().st_size
-        self.file_tracker.track_file(base_hash, file_size_bytes)
+        stat = probe.stat or file_path.stat()
+        # Identical contents were already typed under this hash.
+        already_typed = self.file_tracker.is_file_tracked(base_hash)
+        self.file_tracker.track_file(base_hash, stat.st_size)
         self.file_tracker.track_file_path(base_hash, file_path)
-        self.file_tracker.add_metadata(base_hash, "type", magic.from_file(file_path))
-        self.file_tracker.add_metadata(
-            base_hash, "type_mime", magic.from_file(file_path, mime=True)
-        )
-        extension = file_path.suffix.lstrip(".").lower()
+        if not already_typed:
+            file_type, file_mime = identify(probe.head)
+            self.file_tracker.add_metadata(base_hash, "type", file_type)
+            self.file_tracker.add_metadata(
+                base_hash, "type_mime", sys.intern(file_mime.lower())
+            )
+        self._stat_hashes[self._stat_key(stat)] = base_hash
+        extension = sys.intern(file_path.suffix.lstrip(".").lower())
         self.file_tracker.add_metadata(base_hash, "extension", extension)
 
     def _get_archive_metadata(
-        self, file_path: Path, archiver: BaseArchiver
+        self, base_hash: str, file_path: Path, archiver: BaseArchiver
     ) -> dict | None:
         """Retrieve metadata about an archive, including encrypted file counts and exploded size.
 
+        Archives whose contents were already analyzed under the same hash reuse
+        the tracked results instead of listing the archive again.
+
         Args:
             base_hash (str): The SHA-256 hash of the file.
             file_path (Path): The path to the archive file.
             archiver (BaseArchiver): The archiver to use for size retrieval.
 
         Returns:
-            idictnt | None: Metadata about the archive, or None if retrieval failed.
+            dict | None: Metadata about the archive, or None if retrieval failed.
         """
+        metadata = self.file_tracker.view_file_metadata(base_hash)
+        if "extracted_size" in metadata:
+            return {
+                "encrypted_count": metadata["encrypted_count"],
+                "unencrypted_count": metadata["unencrypted_count"],
+                "total_count": metadata["total_archive_count"],
+                "exploded_size": metadata["extracted_size"],
+            }
         try:
             return archiver.analyze_archive(file_path)
         except NotImplementedError:
@@ -155,37 +302,42 @@ class ArchiveExtractor:
             )
         return None
 
-    def _process_archive(self, base_hash: str, file_path: Path, depth: int) -> None:
+    def _process_archive(
+        self, base_hash: str, file_path: Path, depth: int, archiver: BaseArchiver
+    ) -> ExtractedArchive | None:
         """Process an archive file: validate depth, retrieve size, and extract if appropriate.
 
         Args:
             base_hash (str): The SHA-256 hash of the archive file.
             file_path (Path): The path to the archive file.
             depth (int): The current depth in the archive extraction tree.
+            archiver (BaseArchiver): The archiver selected for the file.
+
+        Returns:
+            ExtractedArchive | None: The extracted archive and its contents to handle, or None if it was not extracted.
         """
-        settings_dict = get_settings()
+        max_depth = self._settings["MAX_DEPTH"]
 
-        # Check if we've reached maximum depth
-        if settings_dict["MAX_DEPTH"] != 0 and depth >= settings_dict["MAX_DEPTH"]:
+        # An archive found inside its own extraction would repeat forever
+        if base_hash in self._active_hashes:
             logger.warning(
-                "%s: File %s is not extracted; max depth reached.",
-                WarningTypes.MAX_DEPTH.name,
+                "%s: File %s is not extracted; it is an archive it was itself extracted from.",
+                WarningTypes.RECURSIVE_ARCHIVE.name,
                 file_path,
             )
-            return
+            return None
 
-        # Get the appropriate archiver for this file
-        archiver = self._get_archiver_for_file(base_hash)
-        if not archiver:
+        # Check if we've reached maximum depth
+        if max_depth != 0 and depth >= max_depth:
             logger.warning(
-                "%s: No suitable archiver found for file: %s",
-                WarningTypes.NO_ARCHIVER.name,
+                "%s: File %s is not extracted; max depth reached.",
+                WarningTypes.MAX_DEPTH.name,
                 file_path,
             )
-            return
+            return None
 
         # Retrieve archive size and calculate compression ratio
-        archive_metadata = self._get_archive_metadata(file_path, archiver)
+        archive_metadata = self._get_archive_metadata(base_hash, file_path, archiver)
         if archive_metadata:
             extracted_size = archive_metadata.get("exploded_size", 0)
             encrypted_count = archive_metadata.get("encrypted_count", 0)
@@ -220,45 +372,41 @@ class ArchiveExtractor:
             self.file_tracker.add_metadata(
                 base_hash, "encryption_status", encryption_status
             )
-            compression_ratio = (
-                extracted_size / self.file_tracker.get_file_size(base_hash)
-                if self.file_tracker.get_file_size(base_hash) > 0
-                else 0
-            )
+            archive_size = self.file_tracker.get_file_size(base_hash)
+            compression_ratio = extracted_size / archive_size if archive_size > 0 else 0
             self.file_tracker.add_metadata(
                 base_hash, "overall_compression_ratio", compression_ratio
             )
 
         # Check if extraction should proceed based on settings
         if not self._should_extract_archive(base_hash, file_path):
-            return
+            return None
 
-        # Extract the archive and process contained files
-        extract_ok = self._extract_archive(archiver, file_path, base_hash)
+        # Extract the archive; its contents are handled, and it is cleaned up, by the caller
+        extraction_dir = self.extract_dir / base_hash
+        extract_ok = self._extract_archive(archiver, file_path, extraction_dir)
+        self._update_free_space(base_hash, extract_ok=extract_ok)
         self.file_tracker.add_metadata(base_hash, "successful_extraction", extract_ok)
 
-        extraction_dir = self.extract_dir / base_hash
         child_files = self._list_child_files(extraction_dir)
-        for child_file in child_files:
-            self._handle_file(child_file, depth + 1)
-
-        self._cleanup(file_path, base_hash)
+        return ExtractedArchive(
+            self._probe_files(child_files), depth + 1, file_path, base_hash
+        )
 
     def _extract_archive(
-        self, archiver: BaseArchiver, file_path: Path, base_hash: str
+        self, archiver: BaseArchiver, file_path: Path, extraction_dir: Path
     ) -> bool:
-        """Extract an archive file to the extraction directory.
+        """Extract an archive file to its extraction directory.
 
         Args:
             archiver (BaseArchiver): The archiver to use for extraction.
             file_path (Path): The path to the archive file.
-            base_hash (str): The SHA-256 hash of the archive file.
+            extraction_dir (Path): The directory to extract the archive to.
 
         Returns:
             bool: True if extraction succeeded without error, False otherwise.
         """
         try:
-            extraction_dir = self.extract_dir / base_hash
             logger.info(
                 "Extracting archive %s to %s",
                 file_path,
@@ -299,76 +447,188 @@ class ArchiveExtractor:
                     str(e),
                 )
 
-    def _is_archive(self, file_hash: str) -> bool:
+    def _get_archiver_for_file(self, file_hash: str) -> BaseArchiver | None:
         """Determine the appropriate archiver for a file based on its metadata.
 
+        Files with no matching archiver are not archives.
+
         Args:
             file_hash (str): The hash of the file.
 
         Returns:
-            bool: True if the file is an archive, otherwise False.
-
+            BaseArchiver | None: The archiver for the file if one supports it, otherwise None.
         """
-        metadata = self.file_tracker.get_file_metadata(file_hash)
-        mime_type = metadata.get("type_mime", "").lower()
-        extension = metadata.get("extension", "").lower()
-
-        for tool in ToolManager.get_tools().values():
-            if mime_type in tool.mime_types or extension in tool.file_extensions:
-                return True
+        metadata = self.file_tracker.view_file_metadata(file_hash)
+        # Stored lowercased and interned by _track_file_metadata
+        mime_type = metadata.get("type_mime", "")
+        extension = metadata.get("extension", "")
+        return ToolManager.get_tool_for(mime_type, extension)
 
-        return False
+    def _update_free_space(self, base_hash: str, *, extract_ok: bool) -> None:
+        """Update the free disk space estimate after an extraction.
 
-    def _get_archiver_for_file(self, file_hash: str) -> BaseArchiver | None:
-        """Determine the appropriate archiver for a file based on its metadata.
+        The estimate is reduced by the archive's expected size, and resampled
+        periodically and after failed extractions so that cleanup and outside
+        changes do not let it drift.
 
         Args:
-            file_hash (str): The hash of the file.
-
-        Returns:
-            str | None: The name of the archiver tool if found, otherwise None.
+            base_hash (str): The hash of the extracted archive.
+            extract_ok (bool): Whether the extraction succeeded.
         """
-        metadata = self.file_tracker.get_file_metadata(file_hash)
-        mime_type = metadata.get("type_mime", "").lower()
-        extension = metadata.get("extension", "").lower()
+        self._extraction_count += 1
+        if not extract_ok or self._extraction_count % FREE_SPACE_RESYNC_INTERVAL == 0:
+            self._free_space = shutil.disk_usage(self.extract_dir).free
+        else:
+            self._free_space -= self.file_tracker.view_file_metadata(base_hash).get(
+                "extracted_size", 0
+            )
 
-        for tool in ToolManager.get_tools().values():
-            if mime_type in tool.mime_types or extension in tool.file_extensions:
-                return tool
-        return None
+    def _resample_free_space(self) -> None:
+        """Replace the free disk space estimate with a fresh sample.
+
+        A previous run's extraction still being removed in the background is
+        waited for first, so the sample includes the space it frees.
+        """
+        if self._cleanup_thread is not None:
+            self._cleanup_thread.join()
+            self._cleanup_thread = None
+        self._free_space = shutil.disk_usage(self.extract_dir).free
 
     @staticmethod
-    def _list_child_files(directory_path: Path, pattern: str = "*") -> list[Path]:
-        """Recursively get a list of files matching a pattern in a directory.
+    def _list_child_files(directory_path: Path, pattern: str = "*") -> Iterator[Path]:
+        """Recursively find files matching a pattern in a directory.
+
+        Files are yielded as the walk finds them, so handling can start before
+        a large extraction has been fully enumerated. Directory entries answer
+        the file/directory checks themselves, mostly without a stat per entry.
+        As with rglob, directories that can't be listed, including a missing
+        starting directory, are skipped.
 
         Args:
             directory_path (Path): The starting directory path.
-            pattern (str): The file pattern to match (e.g., '*.txt', '*.py').
+            pattern (str): The file name pattern to match (e.g., '*.txt', '*.py').
 
-        Returns:
-            list: A list of Path objects for the matching files.
+        Yields:
+            Path: Each matching file.
         """
-        # rglob performs a recursive search
-        files = list(directory_path.rglob(pattern))
-        # Optionally, filter out directories if pattern='*'
-        return [file for file in files if file.is_file()]
+        pending = [os.fspath(directory_path)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as scanner:
+                    entries = list(scanner)
+            except OSError as e:
+                # Like rglob, skip what can't be listed; e.g. a failed
+                # extraction may never have created its directory
+                logger.debug("Could not list %s: %s", directory, e)
+                continue
+            for entry in entries:
+                # Like rglob, don't descend into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file() and (
+                    pattern == "*" or fnmatch.fnmatch(entry.name, pattern)
+                ):
+                    yield Path(entry.path)
+
+    def _probe_files(self, files: Iterable[Path]) -> Iterator[tuple[Path, FileProbe]]:
+        """Hash files on the worker pool, yielding them in their original order.
+
+        Only a bounded number of files is read ahead of the caller, so the size
+        and depth checks made while handling each file still run serially.
 
-    @staticmethod
-    def _sha256_hash_file(file_path: Path) -> str:
-        """Computes the SHA-256 hash of a file.
+        Args:
+            files (Iterable[Path]): The files to hash.
+
+        Yields:
+            tuple[Path, FileProbe]: Each file with its probe.
+        """
+        pending: deque[tuple[Path, Future[FileProbe]]] = deque()
+        for file_path in files:
+            pending.append((file_path, self._pool.submit(self._probe_file, file_path)))
+            if len(pending) > self._prefetch:
+                done_path, future = pending.popleft()
+                yield done_path, future.result()
+        while pending:
+            done_path, future = pending.popleft()
+            yield done_path, future.result()
+
+    def _probe_file(self, file_path: Path) -> FileProbe:
+        """Computes the hash of a file, keeping its stat and leading bytes from the same pass.
+
+        The algorithm is the HASH_ALGORITHM setting, SHA-256 by default.
+
+        Files already handled during this run (the same inode, unchanged since)
+        reuse their hash without being read again; their head is then empty, as
+        that hash has already been typed. Large files are hashed from a memory
+        map instead of a chunked read loop.
 
         Args:
             file_path (Path): The path to the file.
 
         Returns:
-            str: The SHA-256 hash of the file in hexadecimal format.
+            FileProbe: The hash of the file in hexadecimal format, up to HEAD_SIZE leading bytes of the file, and its stat.
         """
         try:
-            with file_path.open("rb") as f:
-                digest = hashlib.file_digest(f, "sha256")
-            return digest.hexdigest()
+            stat = file_path.stat()
+            known_hash = self._stat_hashes.get(self._stat_key(stat))
+            if known_hash is not None:
+                return FileProbe(known_hash, b"", stat)
+            # The hash only identifies contents, so FIPS builds need not
+            # restrict or audit it
+            digest = hashlib.new(self._hash_algorithm, usedforsecurity=False)
+            # Unbuffered: reads go straight from the OS into our own buffer
+            with file_path.open("rb", buffering=0) as f:
+                mapped = None
+                if stat.st_size > MMAP_HASH_THRESHOLD:
+                    # Some filesystems refuse to map, and a file truncated since
+                    # the stat maps as empty; both fall back to the read loop
+                    with contextlib.suppress(OSError, ValueError):
+                        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if mapped is not None:
+                    with mapped:
+                        # Read-ahead hint; not every platform offers madvise
+                        if hasattr(mmap, "MADV_SEQUENTIAL"):
+                            mapped.madvise(mmap.MADV_SEQUENTIAL)
+                        head = mapped[:HEAD_SIZE]
+                        digest.update(mapped)
+                else:
+                    # Read-ahead hint for anything beyond the head; not every
+                    # platform offers posix_fadvise
+                    if stat.st_size > HEAD_SIZE and hasattr(os, "posix_fadvise"):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    head = f.read(HEAD_SIZE)
+                    digest.update(head)
+                    # A short head means the whole file has been read; otherwise
+                    # read the rest in chunks no larger than the file
+                    if len(head) == HEAD_SIZE:
+                        buffer = bytearray(
+                            min(HASH_CHUNK_SIZE, max(stat.st_size, HEAD_SIZE))
+                        )
+                        view = memoryview(buffer)
+                        while size := f.readinto(buffer):
+                            digest.update(view[:size])
         except FileNotFoundError:
-            return "Error: File not found"
+            return FileProbe("Error: File not found", b"", None)
+        return FileProbe(digest.hexdigest(), head, stat)
+
+    @staticmethod
+    def _stat_key(stat: os.stat_result) -> tuple[int, int, int, int, int]:
+        """Key identifying a file's contents by inode and change times, without reading it.
+
+        Args:
+            stat (os.stat_result): The result of stat on the file.
+
+        Returns:
+            tuple[int, int, int, int, int]: The device, inode, size, mtime and ctime of the file.
+        """
+        return (
+            stat.st_dev,
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ctime_ns,
+        )
 
     def get_tracked_files(self) -> dict[str, dict]:
         """Print the tracked files for debugging purposes."""
@@ -399,8 +659,12 @@ class ArchiveExtractor:
 
     def _should_extract_archive(self, file_hash: str, file_path: Path) -> bool:
         """Determine whether an archive should be extracted based on its metadata and current settings."""
-        settings_dict = get_settings()
-        metadata = self.file_tracker.get_file_metadata(file_hash)
+        settings_dict = self._settings
+        max_archive_size = settings_dict["MAX_ARCHIVE_SIZE_BYTES"]
+        max_total_size = settings_dict["MAX_TOTAL_SIZE_BYTES"]
+        min_ratio = settings_dict["MIN_ARCHIVE_RATIO"]
+        min_free_space = settings_dict["MIN_DISK_FREE_SPACE"]
+        metadata = self.file_tracker.view_file_metadata(file_hash)
         if metadata.get("encryption_status") == "ALL":
             logger.warning(
                 "%s: Skipped archive %s because it appears to be fully password protected.",
@@ -409,46 +673,46 @@ class ArchiveExtractor:
             )
             return False
         extracted_size = metadata.get("extracted_size", 0)
-        if extracted_size > settings_dict["MAX_ARCHIVE_SIZE_BYTES"]:
+        if extracted_size > max_archive_size:
             logger.warning(
                 "%s: Skipped archive %s because expected size %s is greater than MAX_ARCHIVE_SIZE_BYTES %s",
                 WarningTypes.MAX_ARCHIVE_SIZE_BYTES.name,
                 file_path,
                 extracted_size,
-                settings_dict["MAX_ARCHIVE_SIZE_BYTES"],
+                max_archive_size,
             )
             return False
 
         total_extracted = self.file_tracker.get_total_tracked_file_size()
-        if total_extracted + extracted_size > settings_dict["MAX_TOTAL_SIZE_BYTES"]:
+        if total_extracted + extracted_size > max_total_size:
             logger.warning(
                 "%s: Skipped archive %s because expected size %s + current tracked files %s is greater than MAX_TOTAL_SIZE_BYTES %s",
                 WarningTypes.MAX_TOTAL_SIZE_BYTES.name,
                 file_path,
                 extracted_size,
                 total_extracted,
-                settings_dict["MAX_TOTAL_SIZE_BYTES"],
+                max_total_size,
             )
             return False
         compression_ratio = metadata.get("overall_compression_ratio", 0)
-        if compression_ratio < settings_dict["MIN_ARCHIVE_RATIO"]:
+        if compression_ratio < min_ratio:
             logger.warning(
                 "%s: Skipped archive %s because compression ratio %.5f is less than MIN_ARCHIVE_RATIO %s",
                 WarningTypes.MIN_ARCHIVE_RATIO.name,
                 file_path,
                 compression_ratio,
-                settings_dict["MIN_ARCHIVE_RATIO"],
+                min_ratio,
             )
             return False
-        if (
-            shutil.disk_usage(self.extract_dir).free - extracted_size
-            < settings_dict["MIN_DISK_FREE_SPACE"]
-        ):
+        if self._free_space - extracted_size < min_free_space:
+            # The estimate may be stale; only skip if a fresh sample agrees
+            self._resample_free_space()
+        if self._free_space - extracted_size < min_free_space:
             logger.warning(
                 "%s: Skipped archive %s because extracting it would leave less than MIN_DISK_FREE_SPACE %s bytes free at extraction location %s",
                 WarningTypes.MIN_DISK_FREE_SPACE.name,
                 file_path,
-                settings_dict["MIN_DISK_FREE_SPACE"],
+                min_free_space,
                 self.extract_dir,
             )
             return False
@@ -456,12 +720,11 @@ class ArchiveExtractor:
 
     def _should_delete_archive(self, file_hash: str, file_path: Path) -> bool:
         """Determine whether an archive should be deleted after extraction based on its metadata and current settings."""
-        settings_dict = get_settings()
-        if not settings_dict["DELETE_ARCHIVES_AFTER_EXTRACTION"]:
+        if not self._settings["DELETE_ARCHIVES_AFTER_EXTRACTION"]:
             return False
 
-        metadata = self.file_tracker.get_file_metadata(file_hash)
-        extension = metadata.get("extension", "").lower()
+        metadata = self.file_tracker.view_file_metadata(file_hash)
+        extension = metadata.get("extension", "")
         if extension in skip_delete_extensions:
             logger.warning(
                 "%s: Archive %s not deleted after extraction due to its extension '%s' being in the skip list.",
@@ -471,7 +734,7 @@ class ArchiveExtractor:
             )
             return False
 
-        mime_type = metadata.get("type_mime", "").lower()
+        mime_type = metadata.get("type_mime", "")
         if mime_type in skip_delete_mimetypes:
             logger.warning(
                 "%s: Archive %s not deleted after extraction due to its mime type '%s' being in the skip list.",
@@ -26,12 +26,12 @@ class BaseArchiver(ABC):
         return self.executable_name
 
     @property
-    def file_extensions(self) -> list[str]:
+    def file_extensions(self) -> frozenset[str]:
         """A non-abstract method that accesses the class impl for the file extensions."""
         return self.__class__.file_extensions  # type: ignore[return-value]
 
     @property
-    def mime_types(self) -> list[str]:
+    def mime_types(self) -> frozenset[str]:
         """A non-abstract method that accesses the class impl for the mime types."""
         return self.__class__.mime_types  # type: ignore[return-value]
 
@@ -1,6 +1,8 @@
 """7zip archiver/extractor implementation."""
 
 import subprocess
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from typing import ClassVar
 
@@ -10,147 +12,150 @@ from .base_archiver import BaseArchiver
 class SevenZipArchiver(BaseArchiver):
     """Archiver implementation for 7zip."""
 
-    file_extensions: ClassVar[list[str]] = [
-        "7z",
-        "s7z",
-        "apk",
-        "bz2",
-        "tbz2",
-        "crx",
-        "xpi",
-        "deb",
-        "gz",
-        "tgz",
-        "ipa",
-        "jar",
-        "ear",
-        "war",
-        "lzma",
-        "cab",
-        "docx",
-        "docm",
-        "pptx",
-        "pptm",
-        "xlsx",
-        "xlsm",
-        "emsix",
-        "emsixbundle",
-        "msix",
-        "appinstaller",
-        "appx",
-        "appxbundle",
-        "msixbundle",
-        "z",
-        "taz",
-        "tar",
-        "zip",
-        "zipx",
-        "appimage",
-        "dmg",
-        "img",
-        "arj",
-        "cpio",
-        "cramfs",
-        "raw",
-        "alz",
-        "ext",
-        "ext2",
-        "ext3",
-        "ext4",
-        "xar",
-        "pkg",
-        "fat",
-        "gpt",
-        "hfs",
-        "hfsx",
-        "iso",
-        "lha",
-        "lhz",
-        "mbr",
-        "chm",
-        "chw",
-        "chi",
-        "chq",
-        "msi",
-        "msp",
-        "vhd",
-        "vhdx",
-        "ntfs",
-        "nsi",
-        "exe",
-        "nsis",
-        "qcow2",
-        "qcow",
-        "qcow2c",
-        "rpm",
-        "rar",
-        "r00",
-        "sqfs",
-        "sfs",
-        "sqsh",
-        "squashfs",
-        "scap",
-        "uefif",
-        "udf",
-        "edb",
-        "edp",
-        "edr",
-        "a",
-        "ar",
-        "deb",
-        "lib",
-        "vdi",
-        "vmdk",
-        "wim",
-        "swm",
-        "esd",
-        "xz",
-        "txz",
-    ]
-    mime_types: ClassVar[list[str]] = [
-        "application/x-7z-compressed",
-        "application/vnd.android.package-archive",
-        "application/x-bzip2",
-        "application/x-chrome-extension",
-        "application/x-xpinstall",
-        "application/vnd.debian.binary-package",
-        "application/gzip",
-        "application/java-archive",
-        "application/x-lzma",
-        "application/vnd.ms-cab-compressed",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        "application/msix",
-        "application/appinstaller",
-        "application/appx",
-        "application/appxbundle",
-        "application/msixbundle",
-        "application/x-compress",
-        "application/x-tar",
-        "application/zip",
-        "application/x-apple-diskimage",
-        "application/x-arj",
-        "application/x-cpio",
-        "application/vnd.efi.img",
-        "application/x-alz-compressed",
-        "application/x-xar",
-        "application/x-iso9660-image",
-        "application/x-lzh",
-        "application/vnd.ms-htmlhelp",
-        "application/x-ole-storage",
-        "application/x-vhd",
-        "text/x-nsis",
-        "application/x-qemu-disk",
-        "application/x-rpm",
-        "application/x-rar-compressed",
-        "application/vnd.squashfs",
-        "application/x-archive",
-        "application/x-virtualbox-vdi",
-        "application/x-vmdk-disk",
-        "application/x-ms-wim",
-        "application/x-xz",
-    ]
+    file_extensions: ClassVar[frozenset[str]] = frozenset(
+        {
+            "7z",
+            "s7z",
+            "apk",
+            "bz2",
+            "tbz2",
+            "crx",
+            "xpi",
+            "deb",
+            "gz",
+            "tgz",
+            "ipa",
+            "jar",
+            "ear",
+            "war",
+            "lzma",
+            "cab",
+            "docx",
+            "docm",
+            "pptx",
+            "pptm",
+            "xlsx",
+            "xlsm",
+            "emsix",
+            "emsixbundle",
+            "msix",
+            "appinstaller",
+            "appx",
+            "appxbundle",
+            "msixbundle",
+            "z",
+            "taz",
+            "tar",
+            "zip",
+            "zipx",
+            "appimage",
+            "dmg",
+            "img",
+            "arj",
+            "cpio",
+            "cramfs",
+            "raw",
+            "alz",
+            "ext",
+            "ext2",
+            "ext3",
+            "ext4",
+            "xar",
+            "pkg",
+            "fat",
+            "gpt",
+            "hfs",
+            "hfsx",
+            "iso",
+            "lha",
+            "lhz",
+            "mbr",
+            "chm",
+            "chw",
+            "chi",
+            "chq",
+            "msi",
+            "msp",
+            "vhd",
+            "vhdx",
+            "ntfs",
+            "nsi",
+            "exe",
+            "nsis",
+            "qcow2",
+            "qcow",
+            "qcow2c",
+            "rpm",
+            "rar",
+            "r00",
+            "sqfs",
+            "sfs",
+            "sqsh",
+            "squashfs",
+            "scap",
+            "uefif",
+            "udf",
+            "edb",
+            "edp",
+            "edr",
+            "a",
+            "ar",
+            "lib",
+            "vdi",
+            "vmdk",
+            "wim",
+            "swm",
+            "esd",
+            "xz",
+            "txz",
+        }
+    )
+    mime_types: ClassVar[frozenset[str]] = frozenset(
+        {
+            "application/x-7z-compressed",
+            "application/vnd.android.package-archive",
+            "application/x-bzip2",
+            "application/x-chrome-extension",
+            "application/x-xpinstall",
+            "application/vnd.debian.binary-package",
+            "application/gzip",
+            "application/java-archive",
+            "application/x-lzma",
+            "application/vnd.ms-cab-compressed",
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            "application/msix",
+            "application/appinstaller",
+            "application/appx",
+            "application/appxbundle",
+            "application/msixbundle",
+            "application/x-compress",
+            "application/x-tar",
+            "application/zip",
+            "application/x-apple-diskimage",
+            "application/x-arj",
+            "application/x-cpio",
+            "application/vnd.efi.img",
+            "application/x-alz-compressed",
+            "application/x-xar",
+            "application/x-iso9660-image",
+            "application/x-lzh",
+            "application/vnd.ms-htmlhelp",
+            "application/x-ole-storage",
+            "application/x-vhd",
+            "text/x-nsis",
+            "application/x-qemu-disk",
+            "application/x-rpm",
+            "application/x-rar-compressed",
+            "application/vnd.squashfs",
+            "application/x-archive",
+            "application/x-virtualbox-vdi",
+            "application/x-vmdk-disk",
+            "application/x-ms-wim",
+            "application/x-xz",
+        }
+    )
     archiver_name: str = "7zip"
     executable_name: str = "7z"
 
@@ -177,6 +182,9 @@ class SevenZipArchiver(BaseArchiver):
             f"-o{extract_dir!s}",
             "-p",
             "-y",
+            # No progress indicator or per-file output; errors still reach stderr
+            "-bd",
+            "-bso0",
         ]
         try:
             subprocess.run(command, check=True, capture_output=True, text=True)  # noqa: S603
@@ -187,29 +195,66 @@ class SevenZipArchiver(BaseArchiver):
             )
             raise RuntimeError(msg) from e
 
-    def get_archive_uncompressed_size(self, archive_path: Path) -> int:
-        """Get the uncompressed size of the contents.
+    def _list_archive(self, archive_path: Path, *args: str) -> Iterator[bytes]:
+        """Stream the technical listing of an archive line by line.
+
+        Lines are left undecoded: only a few ASCII fields are parsed, so entry
+        names never need decoding and cannot fail to decode.
 
         Args:
             archive_path (Path): The path to the archive file.
+            *args (str): Extra switches to pass to 7zip.
 
-        Returns:
-            int: The size of the contents
+        Yields:
+            bytes: Each line of the listing, as 7zip writes it.
+
+        Raises:
+            RuntimeError: If 7zip exits with an error.
         """
-        command: list[str] = [str(self.executable_path), "l", "-slt", str(archive_path)]
-        try:
-            result = subprocess.run(command, check=True, capture_output=True, text=True)  # noqa: S603
-        except subprocess.CalledProcessError as e:
+        command: list[str] = [
+            str(self.executable_path),
+            "l",
+            "-slt",
+            # Bare listing: entry blocks only, without the banner and the
+            # archive's own properties block
+            "-ba",
+            str(archive_path),
+            *args,
+        ]
+        # stderr goes to a file rather than a pipe: with both piped, a lot of
+        # error output would block 7zip while we wait on stdout
+        with (
+            tempfile.TemporaryFile() as stderr_file,
+            subprocess.Popen(  # noqa: S603
+                command,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                bufsize=1 << 20,
+            ) as process,
+        ):
+            yield from process.stdout  # type: ignore[misc]
+            returncode = process.wait()
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors="replace")
+        if returncode != 0:
             msg = (
                 f"7zip size retrieval failed for archive {archive_path} "
-                f"with exit code {e.returncode}: {e.stderr}"
+                f"with exit code {returncode}: {stderr}"
             )
-            raise RuntimeError(msg) from e
+            raise RuntimeError(msg)
 
-        result_lines = str(result.stdout).splitlines()
+    def get_archive_uncompressed_size(self, archive_path: Path) -> int:
+        """Get the uncompressed size of the contents.
+
+        Args:
+            archive_path (Path): The path to the archive file.
+
+        Returns:
+            int: The size of the contents
+        """
         exploded_size = 0
-        for line in result_lines:
-            if line.startswith("Size = "):
+        for line in self._list_archive(archive_path):
+            if line.startswith(b"Size = "):
                 exploded_size += int(line[7:])
 
         return exploded_size
@@ -223,32 +268,14 @@ class SevenZipArchiver(BaseArchiver):
         Returns:
             int: The number of encrypted files in the archive
         """
-        command: list[str] = [
-            str(self.executable_path),
-            "l",
-            "-slt",
-            str(archive_path),
-            "-p",
-            "-y",
-        ]
-        try:
-            result = subprocess.run(command, check=True, capture_output=True, text=True)  # noqa: S603
-        except subprocess.CalledProcessError as e:
-            msg = (
-                f"7zip size retrieval failed for archive {archive_path} "
-                f"with exit code {e.returncode}: {e.stderr}"
-            )
-            raise RuntimeError(msg) from e
-
-        result_lines = str(result.stdout).splitlines()
         exploded_size = 0
         encrypted_count = 0
         unencrypted_count = 0
-        for line in result_lines:
-            if line.startswith("Size = "):
+        for line in self._list_archive(archive_path, "-p", "-y"):
+            if line.startswith(b"Size = "):
                 exploded_size += int(line[7:])
-            if line.startswith("Encrypted = "):
-                if line[12:].strip() == "+":
+            if line.startswith(b"Encrypted = "):
+                if line[12:].strip() == b"+":
                     encrypted_count += 1
                 else:
                     unencrypted_count += 1
@@ -1,9 +1,19 @@
 """File size conversion utilities."""
 
-import re
+from functools import lru_cache
 
 from archae.util.enum.byte_scale import ByteScale
 
+# Byte scale prefix letters, indexed by power of 1024.
+_PREFIXES = tuple(scale.prefix_letter for scale in ByteScale)
+
+# Multiplier for each lowercase prefix letter accepted as a size unit.
+_SCALE_BY_UNIT = {
+    prefix.lower(): 1024**exponent
+    for exponent, prefix in enumerate(_PREFIXES)
+    if prefix
+}
+
 
 def compact_value(value: float) -> str:
     """Convert a float of file size to a FileSize string.
@@ -16,13 +26,15 @@ def compact_value(value: float) -> str:
 
     """
     exponent = 0
-    modulo: float = 0
-    while modulo == 0 and exponent < int(ByteScale.PETA.value):
-        modulo = value % 1024
-        if modulo == 0:
-            exponent += 1
-            value = int(value / 1024)
-    return f"{value}{ByteScale(exponent).prefix_letter}"  # type: ignore[call-arg]
+    size = int(value)
+    # Only whole byte counts can scale; each prefix takes ten trailing zero
+    # bits, counted from the lowest set bit
+    if size == value and size:
+        trailing_zeros = (size & -size).bit_length() - 1
+        exponent = min(trailing_zeros // 10, len(_PREFIXES) - 1)
+    if exponent:
+        value = size >> (10 * exponent)
+    return f"{value}{_PREFIXES[exponent]}"
 
 
 def expand_value(value: str | int) -> int:
@@ -35,27 +47,53 @@ def expand_value(value: str | int) -> int:
         int: Size in bytes
 
     """
-    try:
+    # Plain byte counts are the common case; avoid raising to detect them
+    if isinstance(value, int):
         return int(value)
-    except ValueError:
-        pass
-    except TypeError:
-        pass
-
-    # Regex to split number and unit
-    match = re.match(r"^(\d+(?:\.\d+)?)\s*([KMGTP]B?)$", str(value), re.IGNORECASE)
-    if not match:
+    text = str(value)
+    if text.isdecimal():
+        return int(text)
+
+    size = _parse_size(text)
+    if size is None:
+        # Anything else int() accepts, e.g. padded or underscored numbers
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            pass
         msg = f"{value} is not a valid file size (e.g., 10G, 500M)"
         raise ValueError(msg)
+    return size
+
 
-    number, unit = match.groups()
-    number = float(number)
-    unit = unit[0].upper()
+@lru_cache(maxsize=256)
+def _parse_size(text: str) -> int | None:
+    """Parse a size with a unit, e.g. "10G" or "1.5 kb".
 
-    byte_scale = 1024 ** (ByteScale.from_prefix_letter(unit).value)
+    Settings repeat the same few strings, so results are cached.
 
-    # Default to bytes if no specific unit multiplier, or assume B
-    return int(number * byte_scale)
+    Args:
+        text (str): The size string.
+
+    Returns:
+        int | None: Size in bytes, or None if the text is not a number followed by a unit.
+    """
+    # A single trailing newline is tolerated, e.g. from a value read from a file
+    text = text.removesuffix("\n").lower()
+    number = text.removesuffix("b")
+    unit = number[-1:]
+    number = number[:-1].rstrip()
+    whole, point, fraction = number.partition(".")
+    byte_scale = _SCALE_BY_UNIT.get(unit)
+    if (
+        byte_scale is None
+        or not whole.isdecimal()
+        or (point and not fraction.isdecimal())
+    ):
+        return None
+    if not point:
+        return int(whole) * byte_scale
+    return int(float(number) * byte_scale)
 
 
 def convert(value: str | int) -> int:
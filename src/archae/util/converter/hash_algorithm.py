@@ -0,0 +1,21 @@
+"""Hash algorithm conversion utilities."""
+
+import hashlib
+
+
+def convert(value: str) -> str:
+    """Convert a hash algorithm name to the form hashlib accepts.
+
+    Args:
+        value (str): The algorithm name, e.g. sha256 or blake2b.
+
+    Returns:
+        str: The normalized algorithm name.
+
+    """
+    name = str(value).strip().lower()
+    # SHAKE digests have no fixed length, so they cannot name extraction dirs
+    if name not in hashlib.algorithms_available or name.startswith("shake_"):
+        msg = f"Could not convert {value} to a supported hash algorithm (e.g., sha256, blake2b)"
+        raise ValueError(msg)
+    return name
@@ -0,0 +1,22 @@
+"""Worker count conversion utilities."""
+
+
+def convert(value: str | int) -> int:
+    """Convert a worker count to an int.
+
+    Args:
+        value (str | int): The number of workers, or 0 to match the CPU count.
+
+    Returns:
+        int: The number of workers.
+
+    """
+    try:
+        workers = int(value)
+    except (TypeError, ValueError) as err:
+        msg = f"Could not convert {value} to a worker count: {err}"
+        raise ValueError(msg) from err
+    if workers < 0:
+        msg = f"Could not convert {value} to a worker count: must be 0 or more"
+        raise ValueError(msg)
+    return workers
@@ -20,3 +20,5 @@ class WarningTypes(Enum):
     SKIP_DELETE_MIMETYPE = "SKIP_DELETE_MIMETYPE"
     PASSWORD_PROTECTED_DETECTED = "PASSWORD_PROTECTED_DETECTED"  # noqa: S105
     PASSWORD_PROTECTED_SKIPPED = "PASSWORD_PROTECTED_SKIPPED"  # noqa: S105
+    UNKNOWN_OPTION = "UNKNOWN_OPTION"
+    RECURSIVE_ARCHIVE = "RECURSIVE_ARCHIVE"
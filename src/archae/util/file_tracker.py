@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-import copy
-from typing import Any
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 class FileTracker:
@@ -11,7 +15,16 @@ class FileTracker:
 
     def __init__(self) -> None:
         """Initialize the FileTracker."""
-        self.tracked_files: dict[str, dict] = {}
+        # Each field lives in its own dict keyed by hash, so lookups of one
+        # field do not go through a per-file record.
+        self._sizes: dict[str, int] = {}
+        self._metadata: dict[str, dict[str, Any]] = {}
+        # Insertion-ordered dicts used as sets, so membership checks stay O(1)
+        # for files duplicated many times; exposed as lists.
+        self._paths: dict[str, dict[Any, None]] = {}
+        self._total_size = 0
+        # Guards updates so files can be tracked from worker threads.
+        self._lock = threading.Lock()
 
     def track_file(self, file_hash: str, file_size_bytes: int) -> None:
         """Track a file by its hash.
@@ -20,13 +33,16 @@ class FileTracker:
             file_hash (str): The hash of the file to track.
             file_size_bytes (int): The size of the file in bytes.
         """
-        if file_hash not in self.tracked_files:
-            self.tracked_files[file_hash] = {}
-            self.tracked_files[file_hash]["size"] = file_size_bytes
-            self.tracked_files[file_hash]["metadata"] = {}
-        elif self.tracked_files[file_hash]["size"] != file_size_bytes:
-            msg = f"Hash collision detected for hash {file_hash} with differing sizes."
-            raise RuntimeError(msg)
+        with self._lock:
+            tracked_size = self._sizes.get(file_hash)
+            if tracked_size is None:
+                self._sizes[file_hash] = file_size_bytes
+                self._metadata[file_hash] = {}
+                self._paths[file_hash] = {}
+                self._total_size += file_size_bytes
+            elif tracked_size != file_size_bytes:
+                msg = f"Hash collision detected for hash {file_hash} with differing sizes."
+                raise RuntimeError(msg)
 
     def is_file_tracked(self, file_hash: str) -> bool:
         """Check if a file is tracked by its hash.
@@ -37,7 +53,7 @@ class FileTracker:
         Returns:
             bool: True if the file is tracked, False otherwise.
         """
-        return file_hash in self.tracked_files
+        return file_hash in self._sizes
 
     def get_file_size(self, file_hash: str) -> int:
         """Get the size for a tracked file by its hash.
@@ -48,7 +64,7 @@ class FileTracker:
         Returns:
             int: The size of the tracked file.
         """
-        return self.tracked_files.get(file_hash, {}).get("size", 0)
+        return self._sizes.get(file_hash, 0)
 
     def get_file_metadata(self, file_hash: str) -> dict:
         """Get metadata for a tracked file by its hash.
@@ -57,9 +73,22 @@ class FileTracker:
             file_hash (str): The hash of the file.
 
         Returns:
-            dict: The metadata of the tracked file.
+            dict: A copy of the metadata of the tracked file. Values are plain scalars, so a shallow copy is enough.
         """
-        return copy.deepcopy(self.tracked_files.get(file_hash, {}).get("metadata", {}))
+        return dict(self._metadata.get(file_hash, {}))
+
+    def view_file_metadata(self, file_hash: str) -> Mapping[str, Any]:
+        """Get a read-only view of the metadata for a tracked file by its hash.
+
+        Unlike get_file_metadata, nothing is copied, so later updates show through.
+
+        Args:
+            file_hash (str): The hash of the file.
+
+        Returns:
+            Mapping[str, Any]: The live metadata of the tracked file.
+        """
+        return MappingProxyType(self._metadata.get(file_hash, {}))
 
     def track_file_path(self, file_hash: str, file_path: Any) -> None:
         """Track a file path by its hash.
@@ -68,11 +97,8 @@ class FileTracker:
             file_hash (str): The hash of the file.
             file_path: The path to track.
         """
-        if "paths" not in self.tracked_files[file_hash]:
-            self.tracked_files[file_hash]["paths"] = []
-
-        if file_path not in self.tracked_files[file_hash]["paths"]:
-            self.tracked_files[file_hash]["paths"].append(file_path)
+        with self._lock:
+            self._paths[file_hash][file_path] = None
 
     def add_metadata(self, file_hash: str, key: str, value: Any) -> None:
         """Add metadata to a tracked file.
@@ -82,27 +108,40 @@ class FileTracker:
             key (str): The metadata key.
             value (Any): The metadata value.
         """
-        self.tracked_files[file_hash]["metadata"][key] = value
+        with self._lock:
+            self._metadata[file_hash][key] = value
 
     def get_total_tracked_file_size(self) -> int:
-        """Get the total size of all tracked files.
+        """Get the total size of all tracked files, kept as a running total.
 
         Returns:
             int: The total size in bytes.
         """
-        return sum(
-            self.tracked_files[file_hash].get("size", 0)
-            for file_hash in self.tracked_files
-        )
+        return self._total_size
 
     def get_tracked_files(self) -> dict[str, dict]:
-        """Get all tracked files. This is a deep copy to prevent external modification.
+        """Get all tracked files. This is a copy to prevent external modification.
+
+        Entries are assembled from the per-field dicts; paths and metadata
+        values are immutable, so nothing deeper needs copying.
 
         Returns:
             dict[str, dict]: The tracked files dictionary.
         """
-        return copy.deepcopy(self.tracked_files)
+        with self._lock:
+            return {
+                file_hash: {
+                    "size": size,
+                    "metadata": dict(self._metadata[file_hash]),
+                    "paths": list(self._paths[file_hash]),
+                }
+                for file_hash, size in self._sizes.items()
+            }
 
     def reset_tracked_files(self) -> None:
         """Reset the tracked files."""
-        self.tracked_files = {}
+        with self._lock:
+            self._sizes = {}
+            self._metadata = {}
+            self._paths = {}
+            self._total_size = 0
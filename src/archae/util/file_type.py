@@ -0,0 +1,67 @@
+"""File type identification for archae."""
+
+from __future__ import annotations
+
+import threading
+
+import magic
+
+# Enough leading bytes for libmagic to classify every archive format we
+# handle, including ISO 9660 whose signature sits at offset 32769.
+HEAD_SIZE = 256 * 1024
+
+# Formats whose signature alone decides libmagic's MIME type, as (offset,
+# signature, description, MIME type), checked before falling back to the full
+# magic database. ZIP is deliberately absent: libmagic tells docx, jar, apk and
+# friends apart from plain zips by their contents.
+_SIGNATURES: tuple[tuple[int, bytes, str, str], ...] = (
+    # Tar first: its header starts with a member name, which could look like
+    # any of the prefixes below
+    (257, b"ustar\x0000", "POSIX tar archive", "application/x-tar"),
+    (257, b"ustar  \x00", "POSIX tar archive (GNU)", "application/x-tar"),
+    (0, b"7z\xbc\xaf\x27\x1c", "7-zip archive data", "application/x-7z-compressed"),
+    (0, b"\xfd7zXZ\x00", "XZ compressed data", "application/x-xz"),
+    (0, b"\x28\xb5\x2f\xfd", "Zstandard compressed data", "application/zstd"),
+    (0, b"Rar!\x1a\x07", "RAR archive data", "application/x-rar"),
+    (0, b"\x1f\x8b\x08", "gzip compressed data", "application/gzip"),
+    (0, b"BZh", "bzip2 compressed data", "application/x-bzip2"),
+)
+
+
+# libmagic handles are not thread-safe, so each thread loads its own
+_handles = threading.local()
+
+
+def _magic(*, mime: bool) -> magic.Magic:
+    """Get this thread's libmagic handle, loading the magic database on first use.
+
+    Args:
+        mime (bool): Whether the handle should return MIME types instead of descriptions.
+
+    Returns:
+        magic.Magic: The cached libmagic handle.
+    """
+    name = "mime" if mime else "description"
+    handle = getattr(_handles, name, None)
+    if handle is None:
+        handle = magic.Magic(mime=mime)
+        setattr(_handles, name, handle)
+    return handle
+
+
+def identify(head: bytes) -> tuple[str, str]:
+    """Identify a file from its leading bytes.
+
+    Well-known archive signatures are matched directly; anything else goes
+    through libmagic.
+
+    Args:
+        head (bytes): The leading bytes of the file, up to HEAD_SIZE.
+
+    Returns:
+        tuple[str, str]: The file description and MIME type.
+    """
+    for offset, signature, description, mime_type in _SIGNATURES:
+        if head.startswith(signature, offset):
+            return description, mime_type
+    return _magic(mime=False).from_buffer(head), _magic(mime=True).from_buffer(head)
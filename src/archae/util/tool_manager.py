@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
+import sys
+from functools import cache
 from typing import TYPE_CHECKING, ClassVar, cast
 
 import archae.util.archiver
@@ -15,26 +18,151 @@ if TYPE_CHECKING:
 logger = logging.getLogger("archae")
 
 
+@cache
+def _archiver_classes() -> tuple[type[BaseArchiver], ...]:
+    """Get the archiver implementations, which are all defined at import.
+
+    Returns:
+        tuple[type[BaseArchiver], ...]: The BaseArchiver subclasses.
+    """
+    return tuple(archae.util.archiver.BaseArchiver.__subclasses__())
+
+
+# Located executables by name and PATH. Misses are not remembered, so a tool
+# installed after a lookup is still found by the next one.
+_located: dict[tuple[str, str | None], str] = {}
+
+
+def _which(executable_name: str, search_path: str | None) -> str | None:
+    """Locate an executable, remembering where it was found for the given PATH.
+
+    Args:
+        executable_name (str): The executable to look for.
+        search_path (str | None): The PATH to search, or None for the default search path.
+
+    Returns:
+        str | None: The path to the executable, or None if it was not found.
+    """
+    key = (executable_name, search_path)
+    tool_path = _located.get(key)
+    if tool_path is None:
+        tool_path = shutil.which(executable_name, path=search_path)
+        if tool_path is not None:
+            _located[key] = tool_path
+    return tool_path
+
+
 class ToolManager:
     """Manager for locating and managing external archiving tools."""
 
     __tools: ClassVar[dict[str, BaseArchiver]] = {}
+    __tool_order: ClassVar[tuple[BaseArchiver, ...]] = ()
+    __mime_index: ClassVar[dict[str, int]] = {}
+    __extension_index: ClassVar[dict[str, int]] = {}
+    __aggregates: ClassVar[dict[str, tuple[str, ...]]] = {}
 
     @classmethod
     def locate_tools(cls) -> None:
         """Locate external tools."""
-        for archiver_cls in archae.util.archiver.BaseArchiver.__subclasses__():
+        for archiver_cls in _archiver_classes():
             logger.debug("Locating tool for %s", archiver_cls.archiver_name)
-            tool_path = shutil.which(str(archiver_cls.executable_name))
+            tool_path = _which(
+                cast("str", archiver_cls.executable_name), os.environ.get("PATH")
+            )
             if tool_path:
                 logger.debug("Found %s at %s", archiver_cls.archiver_name, tool_path)
-                cls.__tools[str(archiver_cls.archiver_name)] = archiver_cls(tool_path)  # type: ignore[abstract]
+                archiver_name = cast("str", archiver_cls.archiver_name)
+                cls.__tools[archiver_name] = archiver_cls(tool_path)  # type: ignore[abstract]
             else:
                 logger.warning(
                     "%s: Could not find %s; some archive types may not be supported",
                     WarningTypes.MISSING_ARCHIVER.name,
                     archiver_cls.archiver_name,
                 )
+        cls.__build_index()
+
+    @classmethod
+    def __build_index(cls) -> None:
+        """Map each MIME type and extension to the first located tool supporting it.
+
+        Keys are normalized and interned so lookups with interned metadata
+        strings hit the identity fast path. The supported and unsupported
+        extension and MIME type sets are cached alongside.
+        """
+        cls.__tool_order = tuple(cls.__tools.values())
+        cls.__mime_index = {}
+        cls.__extension_index = {}
+        for position, tool in enumerate(cls.__tool_order):
+            for mime_type in tool.mime_types:
+                cls.__mime_index.setdefault(
+                    sys.intern(mime_type.strip().lower()), position
+                )
+            for extension in tool.file_extensions:
+                cls.__extension_index.setdefault(
+                    sys.intern(extension.strip().lower()), position
+                )
+
+        # Supported and unsupported sets for the status listings
+        archiver_classes = _archiver_classes()
+        all_extensions = frozenset().union(
+            *(cast("frozenset[str]", c.file_extensions) for c in archiver_classes)
+        )
+        all_mime_types = frozenset().union(
+            *(cast("frozenset[str]", c.mime_types) for c in archiver_classes)
+        )
+        supported_extensions = frozenset().union(
+            *(tool.file_extensions for tool in cls.__tool_order)
+        )
+        supported_mime_types = frozenset().union(
+            *(tool.mime_types for tool in cls.__tool_order)
+        )
+        cls.__aggregates = {
+            "supported_extensions": tuple(sorted(supported_extensions)),
+            "unsupported_extensions": tuple(
+                sorted(all_extensions - supported_extensions)
+            ),
+            "supported_mime_types": tuple(sorted(supported_mime_types)),
+            "unsupported_mime_types": tuple(
+                sorted(all_mime_types - supported_mime_types)
+            ),
+        }
+
+    @classmethod
+    def get_tool_for(cls, mime_type: str, extension: str) -> BaseArchiver | None:
+        """Get the first located tool that supports a MIME type or file extension.
+
+        Args:
+            mime_type (str): The lowercase MIME type of the file.
+            extension (str): The lowercase file extension, without the leading dot.
+
+        Returns:
+            BaseArchiver | None: The matching tool, or None if no located tool supports the file.
+        """
+        no_match = len(cls.__tool_order)
+        position = min(
+            cls.__mime_index.get(mime_type, no_match),
+            cls.__extension_index.get(extension, no_match),
+        )
+        if position == no_match:
+            return None
+        return cls.__tool_order[position]
+
+    @classmethod
+    def __aggregate(cls, name: str) -> tuple[str, ...]:
+        """Get a cached, sorted set of extensions or MIME types across archivers.
+
+        The sets are computed with the tool index, or on first use if no tools
+        have been located yet.
+
+        Args:
+            name (str): The name of the aggregate, e.g. "supported_extensions".
+
+        Returns:
+            tuple[str, ...]: The cached set, in sorted order.
+        """
+        if not cls.__aggregates:
+            cls.__build_index()
+        return cls.__aggregates[name]
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
@@ -43,10 +171,7 @@ class ToolManager:
         Returns:
             list[str]: Sorted list of supported file extensions.
         """
-        supported: set[str] = set()
-        for tool in cls.__tools.values():
-            supported.update(tool.file_extensions)
-        return sorted(supported)
+        return list(cls.__aggregate("supported_extensions"))
 
     @classmethod
     def get_unsupported_extensions(cls) -> list[str]:
@@ -55,20 +180,7 @@ class ToolManager:
         Returns:
             list[str]: Sorted list of unsupported file extensions.
         """
-        all_extensions: set[str] = set()
-        supported: set[str] = set()
-
-        # Get all extensions from all archiver classes
-        for archiver_cls in archae.util.archiver.BaseArchiver.__subclasses__():
-            all_extensions.update(cast("list[str]", archiver_cls.file_extensions))
-
-        # Get supported extensions from located tools
-        for tool in cls.__tools.values():
-            supported.update(tool.file_extensions)
-
-        # Return the difference
-        unsupported = all_extensions - supported
-        return sorted(unsupported)
+        return list(cls.__aggregate("unsupported_extensions"))
 
     @classmethod
     def get_supported_mime_types(cls) -> list[str]:
@@ -77,10 +189,7 @@ class ToolManager:
         Returns:
             list[str]: Sorted list of supported MIME types.
         """
-        supported: set[str] = set()
-        for tool in cls.__tools.values():
-            supported.update(tool.mime_types)
-        return sorted(supported)
+        return list(cls.__aggregate("supported_mime_types"))
 
     @classmethod
     def get_unsupported_mime_types(cls) -> list[str]:
@@ -89,20 +198,7 @@ class ToolManager:
         Returns:
             list[str]: Sorted list of unsupported MIME types.
         """
-        all_mime_types: set[str] = set()
-        supported: set[str] = set()
-
-        # Get all MIME types from all archiver classes
-        for archiver_cls in archae.util.archiver.BaseArchiver.__subclasses__():
-            all_mime_types.update(cast("list[str]", archiver_cls.mime_types))
-
-        # Get supported MIME types from located tools
-        for tool in cls.__tools.values():
-            supported.update(tool.mime_types)
-
-        # Return the difference
-        unsupported = all_mime_types - supported
-        return sorted(unsupported)
+        return list(cls.__aggregate("unsupported_mime_types"))
 
     @classmethod
     def get_tools(cls) -> dict[str, BaseArchiver]:
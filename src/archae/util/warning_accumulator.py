@@ -0,0 +1,68 @@
+"""Warning accumulation for archae's logger."""
+
+from __future__ import annotations
+
+import logging
+
+from archae.util.enum.warning_types import WarningTypes
+
+
+class ExtractionWarning:
+    """Warning wrapper class for extraction issues."""
+
+    def __init__(self, message: str, warning_type: WarningTypes) -> None:
+        """Initialize the Warning.
+
+        Args:
+            message (str): The warning message.
+            warning_type (WarningTypes): The type of the warning.
+        """
+        self.message = message
+        self.warning_type = warning_type
+
+
+class WarningAccumulator(logging.Handler):
+    """Logging handler to accumulate warnings while still printing them."""
+
+    def __init__(self) -> None:
+        """Initialize the WarningAccumulator."""
+        super().__init__()
+        self.warnings: list[ExtractionWarning] = []
+        # How many of the warnings belong to the last finished run
+        self._finished_count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Print and accumulate warning messages."""
+        rendered = self.format(record)
+        if record.levelno == logging.WARNING:
+            # Warning messages lead with their WarningTypes name
+            warning_type = WarningTypes[rendered.partition(":")[0]]
+            self.warnings.append(ExtractionWarning(rendered, warning_type))
+        print(rendered)  # noqa: T201
+
+    def clear_warnings(self) -> None:
+        """Clear the accumulated warnings."""
+        self.warnings.clear()
+        self._finished_count = 0
+
+    def start_run(self) -> None:
+        """Drop the warnings of the previous run.
+
+        Warnings logged since it finished, e.g. about options applied for the
+        new run, are kept.
+        """
+        del self.warnings[: self._finished_count]
+        self._finished_count = 0
+
+    def finish_run(self) -> None:
+        """Mark the accumulated warnings as belonging to the run just finished."""
+        self._finished_count = len(self.warnings)
+
+
+# The single handler printing archae's messages, for the CLI and the library
+# alike; it lives apart from the extractor so commands that don't extract
+# can print without importing it.
+logger = logging.getLogger("archae")
+accumulator = WarningAccumulator()
+logger.addHandler(accumulator)
+logger.setLevel(logging.DEBUG)
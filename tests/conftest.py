@@ -0,0 +1,36 @@
+"""Shared fixtures for archae tests."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from archae.config import apply_options, option_keys, settings
+
+SAMPLES_DIR = Path(__file__).resolve().parent / "samples"
+
+
+@pytest.fixture(scope="session")
+def samples() -> dict[str, Path]:
+    """Resolve the sample archives once for the whole session.
+
+    Returns:
+        dict[str, Path]: The sample archive paths, keyed by name.
+    """
+    return {
+        "sample1": SAMPLES_DIR / "sample1.zip",
+        "password_hello": SAMPLES_DIR / "password-hello.zip",
+        "password_partial": SAMPLES_DIR / "password-hello-partial.zip",
+    }
+
+
+@pytest.fixture
+def restore_settings() -> Iterator[None]:
+    """Put every option back to its value from before the test, even if it fails.
+
+    Yields:
+        None: Control to the test.
+    """
+    saved = {key: settings[key] for key in option_keys()}
+    yield
+    apply_options(saved)
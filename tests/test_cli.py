@@ -35,12 +35,16 @@ def test_status() -> None:
     """Does the `status` command run successfully?"""
     result = run_command_in_shell("archae status")
     assert result.exit_code == 0
+    assert "Archae status:" in result.stdout
+    assert "Supported file extensions" in result.stdout
 
 
 def test_listopts() -> None:
     """Does the `listopts` command run successfully?"""
     result = run_command_in_shell("archae listopts")
     assert result.exit_code == 0
+    assert "Available configuration options:" in result.stdout
+    assert "MAX_DEPTH" in result.stdout
 
 
 def test_version_runner(runner: CliRunner) -> None:
@@ -50,10 +54,6 @@ def test_version_runner(runner: CliRunner) -> None:
     assert result.output == f"cli, version {metadata.version('archae')}\n"
 
 
-def test_extraction() -> None:
-    extract_path = Path(__file__).resolve().parent / "output" / "test_cli_extraction"
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    result = run_command_in_shell(
-        f"archae extract tests/samples/sample1.zip -e {extract_path}"
-    )
+def test_extraction(samples: dict[str, Path], tmp_path: Path) -> None:
+    result = run_command_in_shell(f"archae extract {samples['sample1']} -e {tmp_path}")
     assert result.exit_code == 0
@@ -0,0 +1,25 @@
+import logging
+
+import pytest
+
+from archae.config import apply_options, get_settings, settings
+
+pytestmark = pytest.mark.usefixtures("restore_settings")
+
+
+def test_apply_options_any_case() -> None:
+    apply_options({"max_depth": 7})
+    assert get_settings()["MAX_DEPTH"] == 7
+
+
+def test_settings_written_directly() -> None:
+    get_settings()
+    settings.set("MAX_DEPTH", 8)
+    assert get_settings()["MAX_DEPTH"] == 8
+
+
+def test_apply_options_unknown(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING, logger="archae"):
+        apply_options({"NOT_AN_OPTION": 1})
+    assert "UNKNOWN_OPTION" in caplog.text
+    assert "NOT_AN_OPTION" not in get_settings()
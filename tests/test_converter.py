@@ -0,0 +1,66 @@
+import pytest
+
+from archae.util.converter import file_size, hash_algorithm, worker_count
+
+
+@pytest.mark.parametrize(("value", "expected"), [(0, 0), (4, 4), ("8", 8)])
+def test_worker_count(value: str | int, expected: int) -> None:
+    assert worker_count.convert(value) == expected
+
+
+@pytest.mark.parametrize("value", [-1, "-4", "many"])
+def test_worker_count_invalid(value: str | int) -> None:
+    with pytest.raises(ValueError, match="worker count"):
+        worker_count.convert(value)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("sha256", "sha256"), ("SHA256", "sha256"), (" blake2b ", "blake2b")],
+)
+def test_hash_algorithm(value: str, expected: str) -> None:
+    assert hash_algorithm.convert(value) == expected
+
+
+@pytest.mark.parametrize("value", ["shake_128", "shake_256", "not-a-hash"])
+def test_hash_algorithm_invalid(value: str) -> None:
+    with pytest.raises(ValueError, match="supported hash algorithm"):
+        hash_algorithm.convert(value)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (500, 500),
+        ("500", 500),
+        ("-5", -5),
+        ("10G", 10 * 1024**3),
+        ("10 gb", 10 * 1024**3),
+        ("10G\n", 10 * 1024**3),
+        ("1.5K", 1536),
+        ("2P", 2 * 1024**5),
+    ],
+)
+def test_expand_value(value: str | int, expected: int) -> None:
+    assert file_size.expand_value(value) == expected
+
+
+@pytest.mark.parametrize("value", ["1.G", ".5G", "10B", "10X", " 10G", "G", ""])
+def test_expand_value_invalid(value: str) -> None:
+    with pytest.raises(ValueError, match="not a valid file size"):
+        file_size.expand_value(value)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (0, "0"),
+        (1000, "1000"),
+        (2048, "2K"),
+        (1536.0, "1536.0"),
+        (3 * 1024**3, "3G"),
+        (1024**6, "1024P"),
+    ],
+)
+def test_compact_value(value: float, expected: str) -> None:
+    assert file_size.compact_value(value) == expected
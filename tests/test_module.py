@@ -1,178 +1,169 @@
+import hashlib
 import shutil
+import threading
 from pathlib import Path
 
+import pytest
+
 from archae.extractor import ArchiveExtractor
 from archae.util.enum.warning_types import WarningTypes
-
-
-def test_run_as_module() -> None:
-    extract_path = Path(__file__).resolve().parent / "output" / "test_module"
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
-    extractor.handle_file(Path(__file__).resolve().parent / "samples" / "sample1.zip")
-
-
-def test_module_max_depth_warn() -> None:
-    extract_path = (
-        Path(__file__).resolve().parent / "output" / "test_module_max_depth_warn"
-    )
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
-    extractor.apply_options({"MAX_DEPTH": 2})
-    extractor.handle_file(Path(__file__).resolve().parent / "samples" / "sample1.zip")
-    warnings = extractor.get_warnings()
-    assert any(WarningTypes.MAX_DEPTH == warning.warning_type for warning in warnings)
-
-
-def test_module_max_depth_ok() -> None:
-    extract_path = (
-        Path(__file__).resolve().parent / "output" / "test_module_max_depth_ok"
-    )
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
-    extractor.apply_options({"MAX_DEPTH": 5})
-    extractor.handle_file(Path(__file__).resolve().parent / "samples" / "sample1.zip")
-    warnings = extractor.get_warnings()
-    assert not any(
-        WarningTypes.MAX_DEPTH == warning.warning_type for warning in warnings
-    )
-
-
-def test_total_bytes_warn() -> None:
-    extract_path = (
-        Path(__file__).resolve().parent / "output" / "test_module_total_bytes_warn"
-    )
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
-    extractor.apply_options({"MAX_TOTAL_SIZE_BYTES": 100})
-    extractor.handle_file(Path(__file__).resolve().parent / "samples" / "sample1.zip")
-    warnings = extractor.get_warnings()
-    assert any(
-        WarningTypes.MAX_TOTAL_SIZE_BYTES == warning.warning_type
-        for warning in warnings
-    )
-
-
-def test_total_bytes_ok() -> None:
-    extract_path = (
-        Path(__file__).resolve().parent / "output" / "test_module_total_bytes_ok"
-    )
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
-    extractor.apply_options({"MAX_TOTAL_SIZE_BYTES": "10G"})
-    extractor.handle_file(Path(__file__).resolve().parent / "samples" / "sample1.zip")
-    warnings = extractor.get_warnings()
-    assert not any(
-        WarningTypes.MAX_TOTAL_SIZE_BYTES == warning.warning_type
-        for warning in warnings
-    )
-
-
-def test_compression_ratio_warn() -> None:
-    extract_path = (
-        Path(__file__).resolve().parent
-        / "output"
-        / "test_module_compression_ratio_warn"
-    )
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
-    extractor.apply_options({"MIN_ARCHIVE_RATIO": 0.999})
-    extractor.handle_file(Path(__file__).resolve().parent / "samples" / "sample1.zip")
-    warnings = extractor.get_warnings()
-    assert any(
-        WarningTypes.MIN_ARCHIVE_RATIO == warning.warning_type for warning in warnings
-    )
-
-
-def test_compression_ratio_ok() -> None:
-    extract_path = (
-        Path(__file__).resolve().parent / "output" / "test_module_compression_ratio_ok"
-    )
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
-    extractor.apply_options({"MIN_ARCHIVE_RATIO": 0.001})
-    extractor.handle_file(Path(__file__).resolve().parent / "samples" / "sample1.zip")
-    warnings = extractor.get_warnings()
-    assert not any(
-        WarningTypes.MIN_ARCHIVE_RATIO == warning.warning_type for warning in warnings
-    )
-
-
-def test_uncompressed_max_warn() -> None:
-    extract_path = (
-        Path(__file__).resolve().parent / "output" / "test_uncompressed_max_warn"
-    )
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
-    extractor.apply_options({"MAX_ARCHIVE_SIZE_BYTES": 10})
-    extractor.handle_file(Path(__file__).resolve().parent / "samples" / "sample1.zip")
-    warnings = extractor.get_warnings()
-    assert any(
-        WarningTypes.MAX_ARCHIVE_SIZE_BYTES == warning.warning_type
-        for warning in warnings
-    )
-
-
-def test_uncompressed_max_ok() -> None:
-    extract_path = (
-        Path(__file__).resolve().parent / "output" / "test_uncompressed_max_ok"
-    )
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
-    extractor.apply_options({"MAX_ARCHIVE_SIZE_BYTES": "10G"})
-    extractor.handle_file(Path(__file__).resolve().parent / "samples" / "sample1.zip")
-    warnings = extractor.get_warnings()
-    assert not any(
-        WarningTypes.MAX_ARCHIVE_SIZE_BYTES == warning.warning_type
-        for warning in warnings
-    )
-
-
-def test_disk_free_warn() -> None:
-    extract_path = Path(__file__).resolve().parent / "output" / "test_disk_free_warn"
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
-    extractor.apply_options({"MIN_DISK_FREE_SPACE": "10P"})
-    extractor.handle_file(Path(__file__).resolve().parent / "samples" / "sample1.zip")
-    warnings = extractor.get_warnings()
-    assert any(
-        WarningTypes.MIN_DISK_FREE_SPACE == warning.warning_type for warning in warnings
-    )
-
-
-def test_disk_free_ok() -> None:
-    extract_path = Path(__file__).resolve().parent / "output" / "test_disk_free_ok"
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
-    extractor.apply_options({"MIN_DISK_FREE_SPACE": 10})
-    extractor.handle_file(Path(__file__).resolve().parent / "samples" / "sample1.zip")
-    warnings = extractor.get_warnings()
-    assert not any(
-        WarningTypes.MIN_DISK_FREE_SPACE == warning.warning_type for warning in warnings
-    )
-
-
-def test_delete() -> None:
-    extract_path = Path(__file__).resolve().parent / "output" / "test_delete"
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
+from archae.util.tool_manager import ToolManager
+
+from .utils import stage_file, warning_types
+
+# Tests apply options to the process-wide settings
+pytestmark = pytest.mark.usefixtures("restore_settings")
+
+
+def test_run_as_module(samples: dict[str, Path], tmp_path: Path) -> None:
+    extractor = ArchiveExtractor(extract_dir=tmp_path)
+    extractor.handle_file(samples["sample1"])
+
+
+@pytest.mark.parametrize(
+    ("options", "warning_type", "expect_warning"),
+    [
+        ({"MAX_DEPTH": 2}, WarningTypes.MAX_DEPTH, True),
+        ({"MAX_DEPTH": 5}, WarningTypes.MAX_DEPTH, False),
+        ({"MAX_TOTAL_SIZE_BYTES": 100}, WarningTypes.MAX_TOTAL_SIZE_BYTES, True),
+        ({"MAX_TOTAL_SIZE_BYTES": "10G"}, WarningTypes.MAX_TOTAL_SIZE_BYTES, False),
+        ({"MIN_ARCHIVE_RATIO": 0.999}, WarningTypes.MIN_ARCHIVE_RATIO, True),
+        ({"MIN_ARCHIVE_RATIO": 0.001}, WarningTypes.MIN_ARCHIVE_RATIO, False),
+        ({"MAX_ARCHIVE_SIZE_BYTES": 10}, WarningTypes.MAX_ARCHIVE_SIZE_BYTES, True),
+        (
+            {"MAX_ARCHIVE_SIZE_BYTES": "10G"},
+            WarningTypes.MAX_ARCHIVE_SIZE_BYTES,
+            False,
+        ),
+        ({"MIN_DISK_FREE_SPACE": "10P"}, WarningTypes.MIN_DISK_FREE_SPACE, True),
+        ({"MIN_DISK_FREE_SPACE": 10}, WarningTypes.MIN_DISK_FREE_SPACE, False),
+    ],
+)
+def test_option_warning(
+    samples: dict[str, Path],
+    tmp_path: Path,
+    options: dict,
+    warning_type: WarningTypes,
+    *,
+    expect_warning: bool,
+) -> None:
+    extractor = ArchiveExtractor(extract_dir=tmp_path)
+    extractor.apply_options(options)
+    extractor.handle_file(samples["sample1"])
+    assert (warning_type in warning_types(extractor)) == expect_warning
+
+
+def test_delete(samples: dict[str, Path], tmp_path: Path) -> None:
+    extractor = ArchiveExtractor(extract_dir=tmp_path)
     extractor.apply_options({"DELETE_ARCHIVES_AFTER_EXTRACTION": "True"})
-    temp_zip_path = extract_path / "sample1.zip"
-    shutil.copy(
-        Path(__file__).resolve().parent / "samples" / "sample1.zip", temp_zip_path
-    )
+    temp_zip_path = tmp_path / "sample1.zip"
+    stage_file(samples["sample1"], temp_zip_path)
     extractor.handle_file(temp_zip_path)
     assert not Path(temp_zip_path).exists()
 
 
-def test_no_delete() -> None:
-    extract_path = Path(__file__).resolve().parent / "output" / "test_no_delete"
-    Path.mkdir(extract_path, parents=True, exist_ok=True)
-    extractor = ArchiveExtractor(extract_dir=extract_path)
+def test_no_delete(samples: dict[str, Path], tmp_path: Path) -> None:
+    extractor = ArchiveExtractor(extract_dir=tmp_path)
     extractor.apply_options({"DELETE_ARCHIVES_AFTER_EXTRACTION": "False"})
-    temp_zip_path = extract_path / "sample1.zip"
-    shutil.copy(
-        Path(__file__).resolve().parent / "samples" / "sample1.zip", temp_zip_path
-    )
+    temp_zip_path = tmp_path / "sample1.zip"
+    stage_file(samples["sample1"], temp_zip_path)
     extractor.handle_file(temp_zip_path)
     assert Path(temp_zip_path).exists()
+
+
+def test_failed_extraction(tmp_path: Path) -> None:
+    corrupt_zip_path = tmp_path / "corrupt.zip"
+    corrupt_zip_path.write_bytes(b"PK\x03\x04" + b"\x00" * 64)
+    extractor = ArchiveExtractor(extract_dir=tmp_path / "extracted")
+    extractor.apply_options({"MIN_ARCHIVE_RATIO": 0})
+    extractor.handle_file(corrupt_zip_path)
+    assert WarningTypes.EXTRACTION_FAILED in warning_types(extractor)
+
+
+def test_previous_runs_discarded(samples: dict[str, Path], tmp_path: Path) -> None:
+    extract_path = tmp_path / "extracted"
+    (extract_path / "previous").mkdir(parents=True)
+    (extract_path / "previous" / "file.txt").write_text("previous run")
+    # Moved aside by a run stopped before it finished deleting it
+    stale_path = tmp_path / ".extracted-stale.old"
+    (stale_path / "extracted").mkdir(parents=True)
+    extractor = ArchiveExtractor(extract_dir=extract_path)
+    for thread in threading.enumerate():
+        if thread.name == "archae-cleanup":
+            thread.join()
+    assert list(extract_path.iterdir()) == []
+    assert [path.name for path in tmp_path.iterdir()] == ["extracted"]
+    extractor.handle_file(samples["sample1"])
+    assert any(extract_path.iterdir())
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_max_workers(
+    samples: dict[str, Path], tmp_path: Path, max_workers: int
+) -> None:
+    extractor = ArchiveExtractor(extract_dir=tmp_path)
+    extractor.apply_options({"MAX_WORKERS": max_workers})
+    extractor.handle_file(samples["sample1"])
+    assert len(extractor.get_tracked_files()) == 3
+
+
+def test_max_workers_negative(samples: dict[str, Path], tmp_path: Path) -> None:
+    extractor = ArchiveExtractor(extract_dir=tmp_path)
+    extractor.apply_options({"MAX_WORKERS": -1})
+    with pytest.raises(ValueError, match="worker count"):
+        extractor.handle_file(samples["sample1"])
+
+
+def test_hash_algorithm(samples: dict[str, Path], tmp_path: Path) -> None:
+    extractor = ArchiveExtractor(extract_dir=tmp_path)
+    extractor.apply_options({"HASH_ALGORITHM": "blake2b"})
+    extractor.handle_file(samples["sample1"])
+    sample_hash = hashlib.blake2b(samples["sample1"].read_bytes()).hexdigest()
+    assert sample_hash in extractor.get_tracked_files()
+    assert (tmp_path / sample_hash).is_dir()
+
+
+class QuineArchiver:
+    """Fake archiver whose archives contain only a copy of themselves."""
+
+    def __init__(self) -> None:
+        self.extractions = 0
+
+    def analyze_archive(self, archive_path: Path) -> dict:
+        return {
+            "encrypted_count": 0,
+            "unencrypted_count": 1,
+            "total_count": 1,
+            "exploded_size": archive_path.stat().st_size,
+        }
+
+    def extract_archive(self, archive_path: Path, extract_dir: Path) -> None:
+        self.extractions += 1
+        if self.extractions > 10:
+            # Give up with nothing left to list, so a regression fails rather than hangs
+            shutil.rmtree(extract_dir, ignore_errors=True)
+            msg = "still extracting the same archive"
+            raise RuntimeError(msg)
+        extract_dir.mkdir(parents=True, exist_ok=True)
+        (extract_dir / archive_path.name).write_bytes(archive_path.read_bytes())
+
+
+def test_recursive_archive(
+    samples: dict[str, Path], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    archiver = QuineArchiver()
+    monkeypatch.setattr(ToolManager, "get_tool_for", lambda *_: archiver)
+    extractor = ArchiveExtractor(extract_dir=tmp_path)
+    extractor.handle_file(samples["sample1"])
+    assert archiver.extractions == 1
+    assert WarningTypes.RECURSIVE_ARCHIVE in warning_types(extractor)
+
+
+def test_unknown_option_warning(samples: dict[str, Path], tmp_path: Path) -> None:
+    extractor = ArchiveExtractor(extract_dir=tmp_path)
+    extractor.apply_options({"NOT_AN_OPTION": 1})
+    extractor.handle_file(samples["sample1"])
+    assert WarningTypes.UNKNOWN_OPTION in warning_types(extractor)
+    # Only the run the option was applied for reports it
+    extractor.handle_file(samples["sample1"])
+    assert WarningTypes.UNKNOWN_OPTION not in warning_types(extractor)
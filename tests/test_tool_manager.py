@@ -0,0 +1,12 @@
+from pathlib import Path
+
+from archae.util.tool_manager import _which
+
+
+def test_which_finds_tool_installed_later(tmp_path: Path) -> None:
+    search_path = str(tmp_path)
+    assert _which("archae-test-tool", search_path) is None
+    tool = tmp_path / "archae-test-tool"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+    assert _which("archae-test-tool", search_path) == str(tool)
@@ -1,11 +1,16 @@
 """Utility functions for testing archae."""
 
+import shutil
 import subprocess
 from collections.abc import Sequence
 from dataclasses import dataclass
 from os import PathLike
+from pathlib import Path
 from typing import Any
 
+from archae.extractor import ArchiveExtractor
+from archae.util.enum.warning_types import WarningTypes
+
 # copied from `typeshed`
 StrOrBytesPath = str | bytes | PathLike
 Command = StrOrBytesPath | Sequence[StrOrBytesPath]
@@ -37,3 +42,17 @@ def run_command_in_shell(command: Command, **kwargs: Any) -> CommandResult:
         result.stdout.decode().replace("\r\n", "\n"),
         result.stderr.decode().replace("\r\n", "\n"),
     )
+
+
+def warning_types(extractor: ArchiveExtractor) -> set[WarningTypes]:
+    """Collect the types of the warnings an extractor has accumulated."""
+    return {warning.warning_type for warning in extractor.get_warnings()}
+
+
+def stage_file(source: Path, target: Path) -> None:
+    """Place a copy of a file at target, hard linking it when the filesystem allows."""
+    try:
+        target.hardlink_to(source)
+    except OSError:
+        # e.g. the temporary directory is on another device
+        shutil.copy(source, target)